@@ -9,18 +9,30 @@ Usage:
 Notes:
  - Test with --limit-manga N first to avoid heavy scraping.
  - Respect website rules and rate limits. Use moderate delays.
+ - HTTP responses are cached in mangaindo.sqlite for 24h; pass --no-cache to bypass.
 """
 
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.filter import ElementFilter
+import soupsieve as sv
 import time
 import argparse
+import contextlib
+import functools
 import uuid
 from datetime import datetime
 import html
+import multiprocessing
+import os
+import re
 import sys
+import threading
 from urllib.parse import urljoin, urlparse
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 " \
              "(KHTML, like Gecko) Chrome/120.0 Safari/537.36"
@@ -28,140 +40,402 @@ USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 " \
 HEADERS = {"User-Agent": USER_AGENT, "Accept-Language": "en-US,en;q=0.9"}
 BASE_URL = "https://mangaindo.biz"
 
+# Exponential backoff with jitter, honouring Retry-After; only 429/5xx are
+# retried, other 4xx come straight back to safe_get.
+RETRY = Retry(
+    total=3,
+    backoff_factor=1.0,
+    backoff_jitter=0.5,
+    status_forcelist=(429, 500, 502, 503, 504),
+    respect_retry_after_header=True,
+    allowed_methods=("GET",),
+    raise_on_status=False,
+)
+
 session = requests.Session()
 session.headers.update(HEADERS)
 
 
-def safe_get(url, max_retries=3, backoff=1.0, timeout=20):
-    for attempt in range(max_retries):
-        try:
-            r = session.get(url, timeout=timeout)
-            if r.status_code == 200:
-                return r
-            else:
-                print(f"WARN: {url} returned status {r.status_code}", file=sys.stderr)
-                time.sleep(backoff * (attempt + 1))
-        except Exception as e:
-            print(f"ERR: {url} -> {e}", file=sys.stderr)
-            time.sleep(backoff * (attempt + 1))
+def enable_cache(cache_name="mangaindo.sqlite"):
+    """
+    Replace the module session with a sqlite-backed CachedSession. Responses are
+    kept for a day, so re-runs (or a run resumed after a crash) only hit the site
+    for pages that changed or expired; expired entries are revalidated with
+    ETag/Last-Modified when the server sends them. Call configure_session() after.
+    """
+    global session
+    session = requests_cache.CachedSession(
+        cache_name,
+        expire_after=24 * 3600,
+        stale_if_error=True,
+        allowable_codes=(200,),
+    )
+    session.headers.update(HEADERS)
+
+
+def configure_session(pool_size):
+    """
+    Mount an adapter whose connection pool holds `pool_size` connections, so
+    worker threads reuse keep-alive connections instead of reopening TLS once
+    urllib3's default pool (10) is exhausted. Retries are handled by RETRY.
+    """
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          pool_block=False, max_retries=RETRY)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+
+
+configure_session(DEFAULT_POOLSIZE)
+
+# CSS selectors are compiled once here; soupsieve would otherwise re-parse
+# the selector string on every select()/select_one() call.
+# Listing pages: typical theme uses .bsx .bsx or .c-columns .bsx or item-thumb
+# classes. We'll try several selectors that commonly appear in Madara-based themes.
+# The usual Madara markup is tried on its own first; the rest are combined
+# into one selector group (tree walked once) and only used when it matches nothing.
+_CANONICAL_ANCHORS = sv.compile(".page-item-detail .item-thumb a")
+_LIST_ANCHORS = sv.compile(", ".join((
+    ".bsx a",                 # earlier script idea
+    ".page-item-detail .item-thumb a",
+    ".c-page__content .page-listing-item .page-item-detail a",
+    ".post .thumb a",
+    ".item-thumb a",
+    ".cover a",
+)))
+_TT = sv.compile(".tt")
+# One selector group per ancestor level: a single traversal returns the first
+# title-ish node in document order (a .post-title wrapper precedes its h3).
+_NEARBY_TITLE = sv.compile(".post-title, .title, h3, h2")
+_IMG = sv.compile("img")
+_NEXT_LINK = sv.compile("a.next, a.paginate-next, li.next a, .wp-pagenavi a.next")
+_LAST_LINK = sv.compile("a.last, .wp-pagenavi .last a")
+_PAGE_NUMBER = re.compile(r"/page/(\d+)/?")
+_URL_STRIPPED = re.compile("[\t\r\n]")
+_DETAIL_TITLE = tuple(sv.compile(s) for s in (".post-title h1", ".post-title", "h1.entry-title", "h1"))
+_DETAIL_DESC = sv.compile(".summary_content, .entry-content .summary, .main-content .summary, .summary, .post .entry-content")
+_DETAIL_IMG = tuple(sv.compile(s) for s in (".summary_image img", ".post-thumb img", ".entry-content img"))
+_CHAPTER_LINK = sv.compile("li.wp-manga-chapter a")
+
+# Only the list/detail containers are built into the soup; headers, sidebars,
+# footers and scripts are dropped while parsing. Callers fall back to a full
+# parse when a theme variant keeps its content elsewhere.
+_LIST_STRAINER = SoupStrainer(class_=[
+    "bsx", "page-item-detail", "c-page__content", "post", "item-thumb", "cover",
+    # pagination, for find_pagination_next / find_last_page
+    "wp-pagenavi", "pagination", "nav-links", "page-numbers", "next", "paginate-next", "last",
+])
+
+
+class _KeepTags(ElementFilter):
+    """
+    parse_only filter keeping top-level elements named in `names` or carrying
+    one of `classes`, with their whole subtree. Unlike a class_ SoupStrainer it
+    can keep <meta> tags alongside class-matched containers.
+    """
+
+    def __init__(self, names=(), classes=()):
+        super().__init__()
+        self.names = frozenset(names)
+        self.classes = frozenset(classes)
+
+    @property
+    def includes_everything(self):
+        return False
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        if name in self.names:
+            return True
+        cls = (attrs or {}).get("class") or ()
+        if isinstance(cls, str):
+            cls = cls.split()
+        return not self.classes.isdisjoint(cls)
+
+    def allow_string_creation(self, string):
+        # strings outside any kept element
+        return False
+
+
+_DETAIL_STRAINER = _KeepTags(names=["meta", "h1"], classes=[
+    "post-title", "entry-title", "summary_content", "summary", "main-content", "entry-content",
+    "post", "summary_image", "post-thumb", "wp-manga-chapter",
+])
+
+
+def _abs(href, base=BASE_URL):
+    """Absolute URL for href; skips urljoin's full parse when href already is one."""
+    # urljoin also drops tab/CR/LF anywhere in the URL; leave those to it
+    if href and href.startswith(("https://", "http://")) and not _URL_STRIPPED.search(href):
+        return href
+    return urljoin(base, href)
+
+
+def _select_first(selectors, node):
+    """Return the first match of the first selector in `selectors` that matches under `node`."""
+    for sel in selectors:
+        found = sel.select_one(node)
+        if found:
+            return found
+    return None
+
+
+class AdaptiveThrottle:
+    """
+    Paces requests to one host. The interval between requests doubles (up to
+    `cap`) when the server pushes back with 429/5xx or Retry-After, and decays
+    back towards `base` on successful responses. Safe to share between threads.
+    `floors` maps a lane name to a minimum interval between requests made in
+    that lane (e.g. {"list": 1.0}); the pushback interval applies to all lanes.
+    """
+
+    def __init__(self, base=0.0, cap=60.0, floors=None):
+        self.base = base
+        self.cap = cap
+        self.delay = base
+        self.floors = dict(floors or {})
+        self._next_at = 0.0
+        self._lane_next_at = {}
+        self._lock = threading.Lock()
+
+    def wait(self, lane=None):
+        # reserve the next free slot under the lock, sleep outside it
+        with self._lock:
+            now = time.monotonic()
+            at = max(now, self._next_at, self._lane_next_at.get(lane, 0.0))
+            if self.delay:
+                # only pushback spaces out other lanes; a lane's own floor must not
+                self._next_at = at + self.delay
+            if lane in self.floors:
+                self._lane_next_at[lane] = at + max(self.floors[lane], self.delay)
+        if at > now:
+            time.sleep(at - now)
+
+    def on_success(self):
+        with self._lock:
+            delay = self.delay * 0.8
+            self.delay = delay if delay > self.base + 0.01 else self.base
+
+    def on_rate_limit(self):
+        with self._lock:
+            self.delay = min(self.cap, max(self.delay * 2, 1.0))
+
+
+def _pushed_back(r):
+    """True if the server asked us to slow down, on this response or on a retried attempt."""
+    if r.status_code in RETRY.status_forcelist or "Retry-After" in r.headers:
+        return True
+    retries = getattr(r.raw, "retries", None)
+    return bool(retries) and any(h.status in RETRY.status_forcelist for h in retries.history)
+
+
+def _fresh_from_cache(url, timeout):
+    """Fresh cached 200 for `url`, or None (always None when the cache is off)."""
+    if not isinstance(session, requests_cache.CachedSession):
+        return None
+    r = session.get(url, timeout=timeout, only_if_cached=True)
+    if r.status_code == 200 and not r.is_expired:
+        return r
     return None
 
 
-def parse_all_mangas_page(html_text):
+def safe_get(url, timeout=20, throttle=None, lane=None):
+    """
+    GET `url` and return the response if it is a 200, else None.
+    Retry/backoff happens inside the session adapter (see RETRY); `throttle`,
+    if given, paces the request (in `lane`) and is told whether the server pushed back.
+    Fresh cache hits never touch the network, so they skip the throttle.
+    """
+    r = _fresh_from_cache(url, timeout)
+    if r is not None:
+        return r
+    if throttle:
+        throttle.wait(lane)
+    try:
+        r = session.get(url, timeout=timeout)
+    except requests.RequestException as e:
+        print(f"ERR: {url} -> {e}", file=sys.stderr)
+        if throttle:
+            throttle.on_rate_limit()
+        return None
+    if throttle:
+        if _pushed_back(r):
+            throttle.on_rate_limit()
+        else:
+            throttle.on_success()
+    if r.status_code != 200:
+        print(f"WARN: {url} returned status {r.status_code}", file=sys.stderr)
+        return None
+    return r
+
+
+def parse_all_mangas_page(soup):
     """
-    Parse one 'all-mangas' page's HTML and extract manga links+title+thumb.
+    Extract manga links+title+thumb from one parsed 'all-mangas' page.
     This function expects the real page HTML (after JS rendered). For saved HTML,
     it may or may not include full list. We rely on server-side paged markup.
+    The caller parses the page once and reuses the soup for pagination lookups.
     """
-    soup = BeautifulSoup(html_text, "html.parser")
     items = []
-    # Typical theme uses .bsx .bsx or .c-columns .bsx or item-thumb classes.
-    # We'll try several selectors that commonly appear in Madara-based themes.
-    # 1) items inside elements with class 'bsx' or 'page-item-detail' or '.bsx .thumb'
-    selectors = [
-        ".bsx a",                 # earlier script idea
-        ".page-item-detail .item-thumb a",
-        ".c-page__content .page-listing-item .page-item-detail a",
-        ".post .thumb a",
-        ".item-thumb a",
-        ".cover a"
-    ]
+    # anchors inside 'bsx' / 'page-item-detail' / thumb blocks, in document order;
+    # an anchor matched by several selectors is yielded once, `seen` dedupes hrefs
+    anchors = _CANONICAL_ANCHORS.select(soup) or _LIST_ANCHORS.select(soup)
     seen = set()
-    for sel in selectors:
-        for a in soup.select(sel):
-            href = a.get("href")
-            if not href:
-                continue
-            href = urljoin(BASE_URL, href)
-            if href in seen:
-                continue
-            seen.add(href)
-            # try to get title and image inside anchor
-            title = None
-            image = None
-            # title often in sibling or inside .post-title or .tt or .post-title
-            parent = a
-            # find nearby title
-            t = None
-            # look for common title classes
-            candidates = [
-                a.get("title"),
-                a.get("aria-label"),
-                (a.select_one(".tt") and a.select_one(".tt").get_text(strip=True)) if a.select_one(".tt") else None,
-            ]
-            # fallback: look at parent elements for .post-title, .title, h3, h2
-            p = a
-            for _ in range(4):
-                if p is None:
-                    break
-                if t is None:
-                    title_node = p.select_one(".post-title") or p.select_one(".post-title a") or p.select_one(".title") or p.select_one("h3") or p.select_one("h2")
-                    if title_node:
-                        t = title_node.get_text(strip=True)
-                p = p.parent
-            for c in candidates:
-                if c:
-                    title = c.strip()
-                    break
-            if not title and t:
-                title = t.strip()
-            # image
-            img = a.select_one("img")
-            if img:
-                image = img.get("data-src") or img.get("src") or img.get("data-lazy-src")
-                if image:
-                    image = urljoin(BASE_URL, image)
-            # as fallback, check sibling or parent for thumbnail img
-            if not image:
-                par = a.parent
-                if par:
-                    img2 = par.select_one("img")
-                    if img2:
-                        image = img2.get("data-src") or img2.get("src")
-                        if image:
-                            image = urljoin(BASE_URL, image)
-            items.append({"title": title or "", "link": href, "image": image or ""})
+    for a in anchors:
+        href = a.get("href")
+        if not href:
+            continue
+        href = _abs(href)
+        if href in seen:
+            continue
+        seen.add(href)
+        # try to get title and image inside anchor
+        title = None
+        image = None
+        # title often in sibling or inside .post-title or .tt or .post-title
+        # look for common title classes
+        tt = _TT.select_one(a)
+        candidates = [
+            a.get("title"),
+            a.get("aria-label"),
+            tt.get_text(strip=True) if tt else None,
+        ]
+        for c in candidates:
+            if c:
+                title = c.strip()
+                break
+        # fallback: look at parent elements for .post-title, .title, h3, h2
+        # (only when the anchor itself had nothing; stop at the first hit)
+        p = a
+        for _ in range(4):
+            if title or p is None:
+                break
+            title_node = _NEARBY_TITLE.select_one(p)
+            if title_node:
+                title = title_node.get_text(strip=True)
+            p = p.parent
+        # image
+        img = _IMG.select_one(a)
+        if img:
+            image = img.get("data-src") or img.get("src") or img.get("data-lazy-src")
+            if image:
+                image = _abs(image)
+        # as fallback, check sibling or parent for thumbnail img
+        if not image:
+            par = a.parent
+            if par:
+                img2 = _IMG.select_one(par)
+                if img2:
+                    image = img2.get("data-src") or img2.get("src")
+                    if image:
+                        image = _abs(image)
+        items.append({"title": title or "", "link": href, "image": image or ""})
     return items
 
 
+def _parse_in(parse_pool, fn, *args):
+    """Run a top-level parse helper in `parse_pool` (a ProcessPoolExecutor) if given, else inline."""
+    if parse_pool is None:
+        return fn(*args)
+    return parse_pool.submit(fn, *args).result()
+
+
+def _parse_listing(html_text):
+    """
+    Parse a listing page (strained, full-document fallback) ->
+    (items, next_url, (last_page, last_url)). Takes and returns plain data only, so it can
+    run in a worker process.
+    """
+    soup = BeautifulSoup(html_text, "lxml", parse_only=_LIST_STRAINER)
+    items = parse_all_mangas_page(soup)
+    if not items:
+        soup = BeautifulSoup(html_text, "lxml")
+        items = parse_all_mangas_page(soup)
+    return items, find_pagination_next(soup), find_last_page(soup)
+
+
+def _fetch_listing(url, throttle=None, parse_pool=None):
+    """Fetch and parse one listing page; returns _parse_listing's tuple, or None on failure."""
+    r = safe_get(url, throttle=throttle, lane="list")
+    if not r:
+        print(f"Failed to load page {url}", file=sys.stderr)
+        return None
+    return _parse_in(parse_pool, _parse_listing, r.text)
+
+
 def find_pagination_next(soup):
     # look for next page link
-    next_sel = soup.select_one("a.next, a.paginate-next, li.next a, .wp-pagenavi a.next")
+    next_sel = _NEXT_LINK.select_one(soup)
     if next_sel:
-        return urljoin(BASE_URL, next_sel.get("href"))
+        return _abs(next_sel.get("href"))
     # fallback: find page links and choose next by number (not implemented)
     return None
 
 
-def scrape_all_mangas(start_url, limit_manga=0, sleep_between_pages=1.0):
+def find_last_page(soup):
+    """
+    (page number, absolute url) of the explicit "last page" link, or (0, None).
+    Numbered links near the current page are not used: they stop a few pages in.
+    """
+    a = _LAST_LINK.select_one(soup)
+    href = a.get("href") if a else None
+    m = _PAGE_NUMBER.search(href or "")
+    if not m:
+        return 0, None
+    return int(m.group(1)), _abs(href)
+
+
+def _page_url(last_url, k):
+    """`last_url` with its /page/N/ number swapped for k (query string kept)."""
+    m = _PAGE_NUMBER.search(last_url)
+    return last_url[:m.start(1)] + str(k) + last_url[m.end(1):]
+
+
+def scrape_all_mangas(start_url, limit_manga=0, throttle=None, on_new=None, workers=1, parse_pool=None):
     """
     Follow pagination of /all-mangas/ and collect manga entries
+    Returns a dict mapping link -> listing entry, in discovery order.
+    on_new(item) is called for every newly found manga, so detail fetching can
+    start while later listing pages are still being walked.
+    When page 1 has an explicit "last page" link to page N, pages 2..N are
+    fetched in windows of `workers` pages instead of one by one, then the next
+    link of page N is followed as usual; `throttle` paces every request.
+    Pages are parsed in `parse_pool` when one is given.
     """
-    mangas = []
+    mangas = {}
+
+    def add_items(page_items, page_label):
+        # dedupe by link; returns True once limit_manga is reached
+        added = 0
+        for it in page_items:
+            if it['link'] not in mangas:
+                mangas[it['link']] = it
+                added += 1
+                if on_new:
+                    on_new(it)
+                if limit_manga and len(mangas) >= limit_manga:
+                    print(f"Reached limit {limit_manga}", file=sys.stderr)
+                    return True
+        print(f"Added {added} items from page {page_label}", file=sys.stderr)
+        return False
+
     next_url = start_url
     page_count = 0
     while next_url:
         print(f"Fetching page: {next_url}", file=sys.stderr)
-        r = safe_get(next_url)
-        if not r:
-            print(f"Failed to load page {next_url}", file=sys.stderr)
+        parsed_page = _fetch_listing(next_url, throttle, parse_pool)
+        if not parsed_page:
             break
         page_count += 1
-        page_items = parse_all_mangas_page(r.text)
-        # dedupe by link
-        existing_links = {m['link'] for m in mangas}
-        added = 0
-        for it in page_items:
-            if it['link'] not in existing_links:
-                mangas.append(it)
-                existing_links.add(it['link'])
-                added += 1
-                if limit_manga and len(mangas) >= limit_manga:
-                    print(f"Reached limit {limit_manga}", file=sys.stderr)
-                    return mangas
-        print(f"Added {added} items from page {page_count}", file=sys.stderr)
-        soup = BeautifulSoup(r.text, "html.parser")
-        nxt = find_pagination_next(soup)
+        page_items, nxt, (last_page, last_url) = parsed_page
+        if add_items(page_items, page_count):
+            return mangas
+        if page_count == 1 and workers > 1 and last_page > 1:
+            page_urls = [_page_url(last_url, k) for k in range(2, last_page + 1)]
+            done, nxt = _scrape_pages_parallel(page_urls, add_items, throttle, workers, parse_pool)
+            if done:
+                return mangas
+            page_count = last_page
+            next_url = nxt
+            continue
         if not nxt:
             # try page/2 pattern
             # if first run and no next, attempt to guess /page/2/
@@ -173,25 +447,93 @@ def scrape_all_mangas(start_url, limit_manga=0, sleep_between_pages=1.0):
             if not nxt:
                 break
         next_url = nxt
-        time.sleep(sleep_between_pages)
     return mangas
 
 
-def extract_manga_detail(manga_url):
+def _scrape_pages_parallel(page_urls, add_items, throttle, workers, parse_pool=None):
+    """
+    Fetch listing pages in windows of `workers`, feeding them to add_items in
+    page order. Returns (limit_reached, next link of the last page or None).
+    """
+    nxt = None
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        for i in range(0, len(page_urls), workers):
+            window = page_urls[i:i + workers]
+            print(f"Fetching pages: {window[0]} .. {window[-1]}", file=sys.stderr)
+            for url, parsed_page in zip(window, ex.map(lambda u: _fetch_listing(u, throttle, parse_pool), window)):
+                if not parsed_page:
+                    nxt = None
+                    continue
+                if add_items(parsed_page[0], url):
+                    return True, None
+                nxt = parsed_page[1]
+    return False, nxt
+
+
+def extract_manga_detail(manga_url, throttle=None, known=None, need_summary=True, parse_pool=None):
     """
     Get manga detail page: title, description, image (if missing), and attempt to fetch chapters via ajax
+    The ajax chapter list is fetched first. `known` is the listing entry for this
+    manga; when it already has title and image, the ajax call returned chapters
+    and no description is needed (need_summary=False), the detail page is skipped.
+    HTML is parsed in `parse_pool` when one is given.
     """
-    r = safe_get(manga_url)
+    known = known or {}
+    # chapters via ajax endpoint pattern: manga_url + "ajax/chapters/?t=1"
+    chapters = []
+    try:
+        ajax_url = manga_url.rstrip("/") + "/ajax/chapters/?t=1"
+        ar = safe_get(ajax_url, throttle=throttle)
+        if ar and ar.status_code == 200:
+            # response may be HTML fragment with li.wp-manga-chapter
+            chapters = _parse_in(parse_pool, _parse_chapters, ar.text, ajax_url)
+    except Exception as e:
+        print("AJAX chapter fetch failed:", e, file=sys.stderr)
+    if chapters and not need_summary and known.get("title") and known.get("image"):
+        return {"title": known["title"], "description": "", "image": known["image"],
+                "chapters": chapters, "url": manga_url}
+
+    r = safe_get(manga_url, throttle=throttle)
     if not r:
         return None
-    soup = BeautifulSoup(r.text, "html.parser")
+    title, desc, img, page_chapters = _parse_in(parse_pool, _parse_detail, r.text, manga_url)
+    # fallback: chapters listed in the page itself
+    if not chapters:
+        chapters = page_chapters
+
+    return {"title": title, "description": desc, "image": img, "chapters": chapters, "url": manga_url}
+
+
+def _chapter_links(soup, base_url):
+    return [{"title": li.get_text(strip=True), "link": _abs(li.get("href"), base_url)}
+            for li in _CHAPTER_LINK.select(soup)]
+
+
+def _parse_chapters(html_text, base_url):
+    """Chapter list from an ajax/chapters fragment (plain data in and out, process-pool safe)."""
+    return _chapter_links(BeautifulSoup(html_text, "lxml"), base_url)
+
+
+def _parse_detail(html_text, manga_url):
+    """Parse a detail page -> (title, description, image, chapters); process-pool safe."""
+    soup = BeautifulSoup(html_text, "lxml", parse_only=_DETAIL_STRAINER)
+    title, desc, img = _detail_fields(soup, manga_url)
+    if not (title or desc or img):
+        # theme variant whose content lives outside the kept containers
+        soup = BeautifulSoup(html_text, "lxml")
+        title, desc, img = _detail_fields(soup, manga_url)
+    return title, desc, img, _chapter_links(soup, manga_url)
+
+
+def _detail_fields(soup, manga_url):
+    """Pull (title, description, image) out of a parsed manga detail page."""
     # title
-    title_tag = soup.select_one(".post-title h1") or soup.select_one(".post-title") or soup.select_one("h1.entry-title") or soup.select_one("h1")
+    title_tag = _select_first(_DETAIL_TITLE, soup)
     title = title_tag.get_text(strip=True) if title_tag else ""
     # description / synopsis
     desc = ""
     # common selectors
-    desc_sel = soup.select_one(".summary_content, .entry-content .summary, .main-content .summary, .summary, .post .entry-content")
+    desc_sel = _DETAIL_DESC.select_one(soup)
     if desc_sel:
         desc = desc_sel.get_text(separator="\n", strip=True)
     else:
@@ -199,93 +541,110 @@ def extract_manga_detail(manga_url):
         meta_desc = soup.find("meta", {"name": "description"})
         if meta_desc and meta_desc.get("content"):
             desc = meta_desc.get("content").strip()
-    # image: try .summary_image img or og:image
+    # image: try og:image or .summary_image img
     img = None
     og = soup.find("meta", property="og:image")
     if og and og.get("content"):
         img = og.get("content")
     if not img:
-        img_node = soup.select_one(".summary_image img") or soup.select_one(".post-thumb img") or soup.select_one(".entry-content img")
+        img_node = _select_first(_DETAIL_IMG, soup)
         if img_node:
             img = img_node.get("data-src") or img_node.get("src")
     if img:
-        img = urljoin(manga_url, img)
-    # chapters via ajax endpoint pattern: manga_url + "ajax/chapters/?t=1"
-    chapters = []
-    try:
-        ajax_url = manga_url.rstrip("/") + "/ajax/chapters/?t=1"
-        ar = safe_get(ajax_url)
-        if ar and ar.status_code == 200:
-            # response may be HTML fragment with li.wp-manga-chapter
-            a_soup = BeautifulSoup(ar.text, "html.parser")
-            for li in a_soup.select("li.wp-manga-chapter a"):
-                ch_title = li.get_text(strip=True)
-                ch_link = urljoin(ajax_url, li.get("href"))
-                chapters.append({"title": ch_title, "link": ch_link})
-        # fallback: find chapters in page itself
-        if not chapters:
-            for li in soup.select("li.wp-manga-chapter a"):
-                ch_title = li.get_text(strip=True)
-                ch_link = urljoin(manga_url, li.get("href"))
-                chapters.append({"title": ch_title, "link": ch_link})
-    except Exception as e:
-        print("AJAX chapter fetch failed:", e, file=sys.stderr)
+        img = _abs(img, manga_url)
+    return title, desc, img
 
-    return {"title": title, "description": desc, "image": img, "chapters": chapters, "url": manga_url}
 
+# Characters XML 1.0 does not allow at all, not even as character references.
+_XML_ILLEGAL = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]")
 
-def make_atom_entry(title, content_html, link, published=None, categories=None):
-    published = published or datetime.utcnow().isoformat() + "Z"
-    categories = categories or []
-    # Escape title and content
-    t = html.escape(title)
-    cdata = f"<![CDATA[{content_html}]]>"
-    cats_xml = ""
-    for c in categories:
-        cats_xml += f"\n    <category scheme='http://www.blogger.com/atom/ns#' term='{html.escape(c)}'/>"
-    entry = f"""
-  <entry>
-    <title type='text'>{t}</title>
-    <content type='html'>{cdata}</content>
-    <published>{published}</published>
-    <updated>{published}</updated>{cats_xml}
-    <link rel='alternate' type='text/html' href='{html.escape(link)}'/>
-  </entry>
-"""
-    return entry
 
+def _xml_escape(text):
+    """Escape text for an XML element or quoted attribute, dropping illegal characters."""
+    return html.escape(_XML_ILLEGAL.sub("", text))
 
-def build_blogger_feed(manga_details_list, include_chapters=True, include_manga_post=True, blog_title="Mangaindo Import"):
-    feed_id = str(uuid.uuid4())
-    updated = datetime.utcnow().isoformat() + "Z"
-    head = f"""<?xml version='1.0' encoding='UTF-8'?>
+
+def _cdata(text):
+    """Wrap text in a CDATA section; a literal ']]>' is split across two sections."""
+    return "<![CDATA[" + _XML_ILLEGAL.sub("", text).replace("]]>", "]]]]><![CDATA[>") + "]]>"
+
+
+# Feed/entry templates, filled with str.format_map; values must already be escaped.
+_FEED_HEAD = """<?xml version='1.0' encoding='UTF-8'?>
 <feed xmlns='http://www.w3.org/2005/Atom'
       xmlns:openSearch='http://a9.com/-/spec/opensearch/1.1/'
       xmlns:blogger='http://schemas.google.com/blogger/2008'
       xmlns:gd='http://schemas.google.com/g/2005'
       xmlns:thr='http://purl.org/syndication/thread/1.0'>
-<title type='text'>{html.escape(blog_title)}</title>
+<title type='text'>{title}</title>
 <updated>{updated}</updated>
-<id>urn:uuid:{feed_id}</id>
+<id>urn:uuid:{id}</id>
 <author><name>Imported</name></author>
 """
-    entries = ""
+_ENTRY_TMPL = """
+  <entry>
+    <title type='text'>{t}</title>
+    <content type='html'>{c}</content>
+    <published>{p}</published>
+    <updated>{p}</updated>{cats}
+    <link rel='alternate' type='text/html' href='{h}'/>
+  </entry>
+"""
+_FEED_FOOT = "</feed>"
+
+
+@functools.lru_cache(maxsize=None)
+def _category_xml(term):
+    # the handful of category names repeat on every entry; escape each once
+    return f"\n    <category scheme='http://www.blogger.com/atom/ns#' term='{_xml_escape(term)}'/>"
+
+
+def make_atom_entry(title, content_html, link, published, categories=None):
+    categories = categories or []
+    # Escape title and content
+    return _ENTRY_TMPL.format_map({
+        "t": _xml_escape(title),
+        "c": _cdata(content_html),
+        "p": published,
+        "cats": "".join(_category_xml(c) for c in categories),
+        "h": _xml_escape(link),
+    })
+
+
+def iter_blogger_feed(manga_details_list, include_chapters=True, include_manga_post=True, blog_title="Mangaindo Import"):
+    """
+    Yield the Atom feed piece by piece (head, one string per entry, foot), so it
+    can be joined once or written straight to a file.
+    """
+    feed_id = str(uuid.uuid4())
+    # one "now" for the whole run: feed updated time and every entry's published time
+    now_iso = datetime.utcnow().isoformat() + "Z"
+    yield _FEED_HEAD.format_map({"title": _xml_escape(blog_title), "updated": now_iso, "id": feed_id})
     for m in manga_details_list:
+        # per-manga values are escaped once, not once per chapter entry
+        esc_url = html.escape(m.get("url") or "")
+        manga_title = m.get("title") or ""
         # manga post
         if include_manga_post:
-            title = m.get("title") or m.get("url")
-            img_html = f"<p><img src='{html.escape(m.get('image') or '')}' alt='{html.escape(title)}'></p>" if m.get("image") else ""
-            desc_html = f"<p>{html.escape(m.get('description') or '')}</p>" if m.get("description") else ""
-            content_html = f"{img_html}{desc_html}<p>Source: <a href='{html.escape(m.get('url'))}'>{html.escape(m.get('url'))}</a></p>"
-            entries += make_atom_entry(title, content_html, m.get("url"), categories=["Manga", "Komik"])
+            title = manga_title or m.get("url")
+            img_html = f"<p><img src='{html.escape(m.get('image'))}' alt='{html.escape(title)}'></p>" if m.get("image") else ""
+            desc_html = f"<p>{html.escape(m.get('description'))}</p>" if m.get("description") else ""
+            content_html = f"{img_html}{desc_html}<p>Source: <a href='{esc_url}'>{esc_url}</a></p>"
+            yield make_atom_entry(title, content_html, m.get("url"), now_iso, categories=["Manga", "Komik"])
         # chapters
         if include_chapters and m.get("chapters"):
+            from_manga_html = f"<p>From manga: <a href='{esc_url}'>{esc_url}</a></p>"
             for ch in m.get("chapters"):
-                ch_title = f"{(m.get('title') or '')} — {ch.get('title')}"
-                content_html = f"<p>Chapter link: <a href='{html.escape(ch.get('link'))}'>{html.escape(ch.get('link'))}</a></p><p>From manga: <a href='{html.escape(m.get('url'))}'>{html.escape(m.get('url'))}</a></p>"
-                entries += make_atom_entry(ch_title, content_html, ch.get("link"), categories=["Chapter", "Manga"])
-    foot = "</feed>"
-    return head + entries + foot
+                ch_title = f"{manga_title} — {ch.get('title')}"
+                esc_link = html.escape(ch.get("link"))
+                content_html = f"<p>Chapter link: <a href='{esc_link}'>{esc_link}</a></p>{from_manga_html}"
+                yield make_atom_entry(ch_title, content_html, ch.get("link"), now_iso, categories=["Chapter", "Manga"])
+    yield _FEED_FOOT
+
+
+def build_blogger_feed(manga_details_list, include_chapters=True, include_manga_post=True, blog_title="Mangaindo Import"):
+    return "".join(iter_blogger_feed(manga_details_list, include_chapters=include_chapters,
+                                     include_manga_post=include_manga_post, blog_title=blog_title))
 
 
 def main():
@@ -293,26 +652,56 @@ def main():
     parser.add_argument("--start-url", default=urljoin(BASE_URL, "/all-mangas/"), help="All mangas start URL")
     parser.add_argument("--output", default="mangaindo_blogger_import.xml", help="Output XML filename")
     parser.add_argument("--limit-manga", type=int, default=0, help="Limit number of manga to scrape (0 = all)")
-    parser.add_argument("--workers", type=int, default=4, help="Concurrent workers to fetch manga details")
-    parser.add_argument("--delay", type=float, default=1.0, help="Delay between page requests (seconds)")
+    parser.add_argument("--workers", type=int, default=4, help="Concurrent workers for listing pages and manga details (also sizes the connection pool)")
+    parser.add_argument("--parse-workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes for HTML parsing (0 = parse in the fetching threads)")
+    parser.add_argument("--delay", type=float, default=1.0, help="Minimum delay between list page requests (seconds); grows on 429/5xx")
     parser.add_argument("--no-chapters", action="store_true", help="Do not include chapter posts")
     parser.add_argument("--no-manga-posts", action="store_true", help="Do not include manga-level posts (only chapters)")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the local HTTP cache (mangaindo.sqlite)")
     parser.add_argument("--test", action="store_true", help="Quick test run (small limit)")
     args = parser.parse_args()
 
     if args.test and args.limit_manga == 0:
         args.limit_manga = 10
 
-    print("START: scraping list pages...", file=sys.stderr)
-    mangas = scrape_all_mangas(args.start_url, limit_manga=args.limit_manga, sleep_between_pages=args.delay)
-    print(f"Found {len(mangas)} manga links.", file=sys.stderr)
+    # listing pages and manga details are fetched by two pools of args.workers
+    # threads running side by side
+    if not args.no_cache:
+        enable_cache()
+    configure_session(args.workers * 2)
 
-    # fetch details
+    # fetch details while the list pages are still being scraped: every new
+    # manga is submitted to the pool as soon as its listing page is parsed
     details = []
-    with ThreadPoolExecutor(max_workers=args.workers) as ex:
-        future_to_url = {ex.submit(extract_manga_detail, m['link']): m for m in mangas}
+    # one adaptive throttle for the host, shared by listing and detail fetches:
+    # pushback from either slows both; list pages also keep --delay as a floor
+    throttle = AdaptiveThrottle(floors={"list": args.delay})
+    # threads wait on the network; parsing (CPU-bound, GIL-held) goes to a
+    # process pool, fed raw HTML text and returning plain dicts/tuples.
+    # "spawn" because the pool starts while fetch threads are already running.
+    # No more processes than fetch workers: each parse blocks one of them.
+    if args.parse_workers > 0:
+        parsing = ProcessPoolExecutor(max_workers=min(args.parse_workers, args.workers),
+                                      mp_context=multiprocessing.get_context("spawn"))
+    else:
+        parsing = contextlib.nullcontext()
+    with parsing as parse_pool, ThreadPoolExecutor(max_workers=args.workers) as ex:
+        future_to_url = {}
+
+        def submit_detail(m):
+            future_to_url[ex.submit(extract_manga_detail, m['link'], throttle,
+                                    known=m, need_summary=not args.no_manga_posts,
+                                    parse_pool=parse_pool)] = m['link']
+
+        print("START: scraping list pages...", file=sys.stderr)
+        mangas = scrape_all_mangas(args.start_url, limit_manga=args.limit_manga,
+                                   throttle=throttle, on_new=submit_detail,
+                                   workers=args.workers, parse_pool=parse_pool)
+        print(f"Found {len(mangas)} manga links.", file=sys.stderr)
+
         for fut in as_completed(future_to_url):
-            m = future_to_url[fut]
+            m = mangas[future_to_url[fut]]
             try:
                 d = fut.result()
                 if d:
@@ -329,9 +718,10 @@ def main():
                 print(f"ERROR extracting {m['link']}: {e}", file=sys.stderr)
 
     print("Building Blogger Atom XML...", file=sys.stderr)
-    feed_xml = build_blogger_feed(details, include_chapters=not args.no_chapters, include_manga_post=not args.no_manga_posts)
+    # stream entries to disk instead of holding the whole feed in memory
     with open(args.output, "w", encoding="utf-8") as f:
-        f.write(feed_xml)
+        f.writelines(iter_blogger_feed(details, include_chapters=not args.no_chapters,
+                                       include_manga_post=not args.no_manga_posts))
     print(f"Saved {args.output} (manga: {len(details)})", file=sys.stderr)
 
 